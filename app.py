@@ -6,6 +6,7 @@ GE Appliances Dashboard - Real-time monitoring for washer and dryer
 import asyncio
 import json
 import queue
+import sys
 import threading
 import time
 from datetime import datetime
@@ -80,6 +81,8 @@ DRYER_ERDS = [
     ErdCode.LAUNDRY_DRYER_SHEET_INVENTORY,
     ErdCode.LAUNDRY_DRYER_WASHERLINK_STATUS,
     ErdCode.LAUNDRY_DRYER_DAMP_ALERT_STATUS,
+    ErdCode.LAUNDRY_DRYER_DAMP_ALERT_OPTION_SELECTION,
+    ErdCode.LAUNDRY_WASHER_LINK_DATA,  # Cycle count stats via WasherLink
     # Allowables (what can be controlled)
     ErdCode.LAUNDRY_DRYER_TEMPERATURE_OPTION_ALLOWABLES,
     ErdCode.LAUNDRY_DRYER_DRYNESS_OPTION_ALLOWABLES,
@@ -92,6 +95,22 @@ DRYER_ERDS = [
     ErdCode.LAUNDRY_DRYER_BLOCKED_VENT_FAULT,
 ]
 
+# Property retention policy
+# Only the ERDs above are cached by default; anything else the appliance reports
+# can be fetched on demand via /api/appliances/<mac>/properties/<erd>
+EXTRA_TRACKED_ERDS = []  # ERD names to cache in addition to the lists above
+RETAIN_ALL_KNOWN_PROPERTIES = False  # True caches every known ERD (unbounded)
+MAX_RAW_VALUE_LENGTH = 256  # Longer raw values (e.g. byte blobs) are truncated
+MAX_DISPLAY_VALUE_LENGTH = 128
+
+# Pool for sharing repeated display strings ("Off", "Inactive", ...) between
+# appliances. Only short values are pooled and the pool is capped, because
+# sys.intern'd strings can be immortal (CPython 3.12+) and ever-changing values
+# like time remaining would otherwise grow it for the life of the process.
+MAX_POOLED_DISPLAY_LENGTH = 32
+MAX_DISPLAY_POOL_SIZE = 1024
+display_pool = {}
+
 
 def parse_complex_value(value, erd_name):
     """Parse complex ERD values into structured data"""
@@ -186,6 +205,66 @@ def stringify_value(appliance, erd_code, value):
         return str(value)
 
 
+def erd_name_for(erd_code):
+    """Get the interned name for an ERD code"""
+    # Safe to intern: names come from the fixed ERD code space
+    if isinstance(erd_code, ErdCode):
+        return sys.intern(erd_code.name)
+    return sys.intern(str(erd_code))
+
+
+def cap_string(value, limit):
+    """Truncate a string to limit characters, noting the original length"""
+    if len(value) <= limit:
+        return value
+    return f"{value[:limit]}... ({len(value)} chars)"
+
+
+def pool_display(value):
+    """Share a short display string through the capped display pool"""
+    pooled = display_pool.get(value)
+    if pooled is not None:
+        return pooled
+    if len(value) <= MAX_POOLED_DISPLAY_LENGTH and len(display_pool) < MAX_DISPLAY_POOL_SIZE:
+        display_pool[value] = value
+    return value
+
+
+def build_property(appliance, erd_code, value):
+    """Build the cached raw/display entry for an ERD value (capped later)"""
+    return {
+        "raw": str(value),
+        "display": stringify_value(appliance, erd_code, value)
+    }
+
+
+def tracked_erds(app_type):
+    """Get the ERD codes always cached for an appliance type"""
+    erds = COMMON_ERDS.copy()
+    if app_type == "dryer":
+        erds.extend(DRYER_ERDS)
+    elif app_type == "washer":
+        erds.extend(WASHER_ERDS)
+    return erds
+
+
+def is_retained_erd(erd_name, tracked_names):
+    """Check whether the retention policy caches an ERD"""
+    return (
+        erd_name in tracked_names
+        or RETAIN_ALL_KNOWN_PROPERTIES
+        or erd_name in EXTRA_TRACKED_ERDS
+    )
+
+
+def find_known_erd(appliance, erd_name):
+    """Find an appliance's known ERD code by name, or None"""
+    for erd_code in list(appliance.known_properties):
+        if erd_name_for(erd_code) == erd_name:
+            return erd_code
+    return None
+
+
 def get_appliance_state(appliance):
     """Extract all relevant state from an appliance"""
     import re
@@ -213,39 +292,33 @@ def get_appliance_state(appliance):
     }
 
     # Get common properties
-    erds_to_check = COMMON_ERDS.copy()
-    if is_dryer:
-        erds_to_check.extend(DRYER_ERDS)
-    elif is_washer:
-        erds_to_check.extend(WASHER_ERDS)
+    erds_to_check = tracked_erds(state["type"])
+    tracked_names = {erd_name_for(erd_code) for erd_code in erds_to_check}
 
     for erd_code in erds_to_check:
         try:
             value = appliance.get_erd_value(erd_code)
             if value is not None:
-                state["properties"][erd_code.name] = {
-                    "raw": str(value),
-                    "display": stringify_value(appliance, erd_code, value)
-                }
+                state["properties"][erd_name_for(erd_code)] = build_property(appliance, erd_code, value)
         except (KeyError, AttributeError, Exception):
             pass
 
-    # Also get any other known properties (known_properties is a set of keys)
-    for erd_code in appliance.known_properties:
-        if isinstance(erd_code, ErdCode):
-            erd_name = erd_code.name
-        else:
-            erd_name = str(erd_code)
-
-        if erd_name not in state["properties"]:
-            try:
-                value = appliance.get_erd_value(erd_code)
-                state["properties"][erd_name] = {
-                    "raw": str(value),
-                    "display": stringify_value(appliance, erd_code, value)
-                }
-            except (KeyError, AttributeError, Exception):
-                pass
+    # Other known properties (known_properties is a set of keys) are only
+    # cached when allowed by the retention policy
+    untracked = 0
+    for erd_code in list(appliance.known_properties):
+        erd_name = erd_name_for(erd_code)
+        if erd_name in tracked_names:
+            continue
+        if not is_retained_erd(erd_name, tracked_names):
+            untracked += 1
+            continue
+        try:
+            value = appliance.get_erd_value(erd_code)
+            state["properties"][erd_name] = build_property(appliance, erd_code, value)
+        except (KeyError, AttributeError, Exception):
+            pass
+    state["untracked_properties"] = untracked
 
     # Extract controls (what can be set) from allowables
     props = state["properties"]
@@ -323,6 +396,12 @@ def get_appliance_state(appliance):
     remote_status = props.get("LAUNDRY_REMOTE_STATUS", {}).get("display", "False")
     state["remote_enabled"] = remote_status == "True"
 
+    # Cap value sizes last so controls and stats above see the full values,
+    # and pool only the capped display strings that are actually stored
+    for prop in props.values():
+        prop["raw"] = cap_string(prop["raw"], MAX_RAW_VALUE_LENGTH)
+        prop["display"] = pool_display(cap_string(prop["display"], MAX_DISPLAY_VALUE_LENGTH))
+
     return state
 
 
@@ -344,14 +423,16 @@ async def on_state_change(data):
     # Update our cached state
     appliance_data[mac] = get_appliance_state(appliance)
 
-    # Build change summary for frontend
+    # Build change summary for frontend; untracked ERDs are reported with a
+    # capped display so the frontend can fetch the full value on demand
     changes = {}
+    retained = appliance_data[mac]["properties"]
     for erd_code, value in state_changes.items():
-        if isinstance(erd_code, ErdCode):
-            erd_name = erd_code.name
+        erd_name = erd_name_for(erd_code)
+        if erd_name in retained:
+            changes[erd_name] = retained[erd_name]["display"]
         else:
-            erd_name = str(erd_code)
-        changes[erd_name] = stringify_value(appliance, erd_code, value)
+            changes[erd_name] = cap_string(stringify_value(appliance, erd_code, value), MAX_DISPLAY_VALUE_LENGTH)
 
     update_queue.put({
         "event": "state_change",
@@ -513,6 +594,95 @@ def api_appliances():
     })
 
 
+@app.route("/api/appliances/<mac>/properties")
+def api_list_properties(mac):
+    """List cached and on-demand ERD names for an appliance"""
+    appliance = appliance_objects.get(mac)
+    if not appliance:
+        return jsonify({"success": False, "error": "Appliance not found"}), 404
+
+    app_type = appliance_data.get(mac, {}).get("type", "unknown")
+    tracked_names = {erd_name_for(erd_code) for erd_code in tracked_erds(app_type)}
+    names = sorted(erd_name_for(erd_code) for erd_code in list(appliance.known_properties))
+    return jsonify({
+        "success": True,
+        "tracked": [name for name in names if is_retained_erd(name, tracked_names)],
+        "untracked": [name for name in names if not is_retained_erd(name, tracked_names)]
+    })
+
+
+@app.route("/api/appliances/<mac>/properties/<erd_name>")
+def api_get_property(mac, erd_name):
+    """Fetch the current full (uncapped) value of any known ERD"""
+    appliance = appliance_objects.get(mac)
+    if not appliance:
+        return jsonify({"success": False, "error": "Appliance not found"}), 404
+
+    erd_code = find_known_erd(appliance, erd_name)
+    if erd_code is None:
+        return jsonify({"success": False, "error": f"Unknown ERD: {erd_name}"}), 404
+
+    try:
+        value = appliance.get_erd_value(erd_code)
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+    return jsonify({
+        "success": True,
+        "erd": erd_name,
+        "raw": str(value),
+        "display": stringify_value(appliance, erd_code, value)
+    })
+
+
+def deep_sizeof(obj, seen):
+    """Approximate memory used by obj and its contents, skipping ids in seen"""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+
+def memory_report():
+    """Report cached state memory in bytes per appliance and per ERD.
+
+    Interned and pooled strings shared between appliances are counted against each
+    appliance, so the totals are an upper bound.
+    """
+    appliances = {}
+    for mac, state in list(appliance_data.items()):
+        seen = set()
+        erds = {}
+        for erd_name, prop in list(state.get("properties", {}).items()):
+            erds[erd_name] = deep_sizeof(erd_name, seen) + deep_sizeof(prop, seen)
+        appliances[mac] = {
+            "total_bytes": sum(erds.values()) + deep_sizeof(state, seen),
+            "properties_bytes": sum(erds.values()),
+            "property_count": len(erds),
+            "untracked_properties": state.get("untracked_properties", 0),
+            "erds": erds
+        }
+
+    total = sum(a["total_bytes"] for a in appliances.values())
+    return {
+        "appliance_count": len(appliances),
+        "total_bytes": total,
+        "average_bytes_per_appliance": total // len(appliances) if appliances else 0,
+        "appliances": appliances
+    }
+
+
+@app.route("/api/memory")
+def api_memory():
+    """Get a memory-accounting report for cached appliance state"""
+    return jsonify(memory_report())
+
+
 @app.route("/api/appliances/<mac>/set", methods=["POST"])
 def api_set_value(mac):
     """Set a value on an appliance"""